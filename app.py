@@ -353,7 +353,7 @@ class VisualNovelTranslatorApp:
 
         print(f"Setting OCR engine to: {engine_type}")
         self.ocr_engine_type = engine_type
-        set_setting("ocr_engine", engine_type) # Save preference
+        # Preference is persisted by the capture tab's debounced settings flush
         self._trigger_ocr_initialization(engine_type, lang_code)
 
     def update_ocr_language(self, lang_code, engine_type):
@@ -366,7 +366,7 @@ class VisualNovelTranslatorApp:
 
         print(f"Setting OCR language to: {lang_code} for engine {engine_type}")
         self.ocr_lang = lang_code
-        set_setting("ocr_language", lang_code) # Save preference
+        # Preference is persisted by the capture tab's debounced settings flush
         # Always trigger re-initialization when language changes, using the current engine type
         self._trigger_ocr_initialization(engine_type, lang_code)
 
@@ -827,8 +827,9 @@ class VisualNovelTranslatorApp:
                 initial_config=snip_config,
                 manager_ref=None # Snip window is independent of the manager
             )
-            # The window's __init__ calls _update_visibility, which for Closable...
-            # ensures it becomes visible. update_text below will handle resizing.
+            # The window's __init__ calls _apply_visibility synchronously, which for
+            # Closable makes it visible right away (_update_visibility only defers to
+            # idle, so don't rely on it here). update_text below will handle resizing.
 
             # --- Position the snip window intelligently (BEFORE resizing) ---
             # Default position: to the right of the snipped region
@@ -1486,7 +1487,7 @@ class VisualNovelTranslatorApp:
                         x_str, y_str = parts[1], parts[2]
                         # Basic check if coordinates look valid
                         if x_str.isdigit() and y_str.isdigit():
-                            set_setting("floating_controls_pos", f"{x_str},{y_str}")
+                            set_setting("floating_controls_pos", [int(x_str), int(y_str)])
                         else: print(f"Warn: Invalid floating controls coordinates in geometry: {geo}")
                     else: print(f"Warn: Could not parse floating controls geometry: {geo}")
             except Exception as e: print(f"Error saving floating controls position: {e}")
@@ -1,9 +1,20 @@
+import logging
+import logging.handlers
+import queue
 import tkinter as tk
 import os
 from app import VisualNovelTranslatorApp
 from utils.translation import CACHE_DIR
 
 if __name__ == "__main__":
+    # Module loggers only emit warnings and errors; debug messages are not formatted.
+    # Records go through a queue so console writes never block the Tk thread.
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.handlers.QueueHandler(log_queue)])
+    log_listener.start()
     root = tk.Tk()
 
     try:
@@ -35,3 +46,5 @@ if __name__ == "__main__":
             messagebox.showerror("Fatal Error", f"An unexpected error occurred:\n\n{e}\n\nSee console for details.")
         except Exception:
             pass
+    finally:
+        log_listener.stop()
@@ -1,31 +1,39 @@
 # --- START OF FILE capture_tab.py ---
 
+import logging
+import threading
 import tkinter as tk
 from tkinter import ttk
 from ui.base import BaseTab
-from utils.capture import get_windows, get_window_title
-from utils.settings import get_setting, set_setting
+from utils.capture import get_windows_with_titles
+from utils.settings import get_setting, set_setting, update_settings
 # Import availability checks for all relevant engines
 from utils.ocr import _windows_ocr_available, _tesseract_available, _paddle_available, _easyocr_available
 
+log = logging.getLogger(__name__)
+
 class CaptureTab(BaseTab):
-    OCR_LANGUAGES = ["jpn", "jpn_vert", "eng", "chi_sim", "chi_tra", "kor"]
-
-    # Define available engines dynamically based on imports
-    OCR_ENGINES = []
-    if _paddle_available:
-        OCR_ENGINES.append("paddle")
-    if _easyocr_available:
-        OCR_ENGINES.append("easyocr")
-    if _windows_ocr_available:
-        OCR_ENGINES.append("windows")
-    if _tesseract_available:
-        OCR_ENGINES.append("tesseract")
+    OCR_LANGUAGES = ("jpn", "jpn_vert", "eng", "chi_sim", "chi_tra", "kor")
+
+    # Available engines, fixed at import from the availability flags
+    OCR_ENGINES = tuple(engine for engine, available in (
+        ("paddle", _paddle_available),
+        ("easyocr", _easyocr_available),
+        ("windows", _windows_ocr_available),
+        ("tesseract", _tesseract_available),
+    ) if available)
 
     # Set a default engine if the list is somehow empty, or use the first available
     DEFAULT_OCR_ENGINE = OCR_ENGINES[0] if OCR_ENGINES else "none" # Handle case where no engines are available
 
     def setup_ui(self):
+        self.window_handles = []
+        self.window_titles = [] # Full (untruncated) titles, parallel to window_handles
+        self._last_selected_index = -1 # Combobox index handled by the last selection event
+        self._refresh_after_id = None # Pending debounced refresh
+        self._refresh_generation = 0 # Bumped per refresh; only the latest worker's result applies
+        self._settings_after_id = None # Pending write-behind of OCR settings
+
         capture_frame = ttk.LabelFrame(self.frame, text="Capture Settings", padding="10")
         capture_frame.pack(fill=tk.X, pady=10)
 
@@ -95,35 +103,105 @@ class CaptureTab(BaseTab):
         self.lang_combo.pack(side=tk.LEFT, anchor=tk.W, padx=5)
         self.lang_combo.bind("<<ComboboxSelected>>", self.on_language_changed)
 
+        # Persist engine/language changes via a coalesced write-behind
+        self.engine_var.trace_add("write", self._queue_settings_flush)
+        self.lang_var.trace_add("write", self._queue_settings_flush)
+
         # --- Status Label ---
         self.status_label = ttk.Label(capture_frame, text="Status: Ready")
         self.status_label.pack(fill=tk.X, pady=(10, 0), anchor=tk.W)
 
-        # Initial population
-        self.refresh_window_list()
+        # --- Widget state tables for capture start/stop ---
+        self._capturing_states = [
+            (self.start_btn, ["disabled"]),
+            (self.refresh_btn, ["disabled"]),
+            (self.window_combo, ["disabled"]),
+            # Engine/lang combos stay enabled while capturing
+            (self.stop_btn, ["!disabled"]),
+            (self.snapshot_btn, ["!disabled"]),
+            (self.live_view_btn, ["disabled"]), # Cannot return to live if already live
+        ]
+        self._stopped_states = [
+            (self.start_btn, ["!disabled"]),
+            (self.refresh_btn, ["!disabled"]),
+            (self.window_combo, ["!disabled", "readonly"]), # Re-enable selection
+            (self.lang_combo, ["!disabled", "readonly"]),
+            (self.stop_btn, ["disabled"]),
+            (self.snapshot_btn, ["disabled"]), # Cannot snapshot if not capturing
+            (self.live_view_btn, ["disabled"]),
+        ]
+        if self.OCR_ENGINES: # Only re-enable if engines are actually available
+            self._stopped_states.append((self.engine_combo, ["!disabled", "readonly"]))
+
+        # Initial population runs synchronously: the Tk main loop is not running yet,
+        # so a worker thread could not hand its result back with after_idle
+        self.window_combo.config(state=tk.NORMAL)
+        try:
+            self._apply_window_list(self._collect_windows(self.app.master.title()))
+        except Exception as e:
+            self._on_refresh_error(str(e))
         # Initial setup of OCR engine based on default/saved value
         self.app.set_ocr_engine(self.engine_var.get(), self.lang_var.get())
 
 
     def refresh_window_list(self):
+        """Schedules a window list refresh, coalescing rapid repeated requests."""
+        if self._refresh_after_id is not None:
+            try:
+                self.frame.after_cancel(self._refresh_after_id)
+            except tk.TclError:
+                pass
+        self._refresh_after_id = self.frame.after(300, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_after_id = None
+        if self.app.capturing:
+            return # A refresh queued before Start Capture must not unlock the window selection
         self.app.update_status("Refreshing window list...")
         self.window_combo.config(state=tk.NORMAL)
         self.window_combo.set("")
+        # Read the app title here; the worker must not touch Tk
+        app_title = self.app.master.title()
+        self._refresh_generation += 1
+        threading.Thread(target=self._enumerate_windows_worker,
+                         args=(app_title, self._refresh_generation), daemon=True).start()
+
+    def _enumerate_windows_worker(self, app_title, generation):
+        """Enumerates and filters windows off the Tk thread, then hands the result back."""
         try:
-            windows = get_windows()
-            filtered_windows = {}
-            app_title = self.app.master.title()
-            for hwnd in windows:
-                title = get_window_title(hwnd)
-                # Basic filtering
-                if title and title != app_title and "Program Manager" not in title and "Default IME" not in title:
-                    # Limit title length for display
-                    display_title = title[:80] + '...' if len(title) > 80 else title
-                    filtered_windows[hwnd] = f"{hwnd}: {display_title}"
-
-            window_titles = list(filtered_windows.values())
+            filtered_windows = self._collect_windows(app_title)
+        except Exception as e:
+            self.app.master.after_idle(lambda msg=str(e): self._on_refresh_error(msg, generation))
+            return
+        self.app.master.after_idle(lambda: self._apply_window_list(filtered_windows, generation))
+
+    @staticmethod
+    def _collect_windows(app_title):
+        """Returns {hwnd: (display title, full title)} for selectable windows. Does not touch Tk."""
+        filtered_windows = {}
+        for hwnd, title in get_windows_with_titles():
+            # Basic filtering
+            if title and title != app_title and "Program Manager" not in title and "Default IME" not in title:
+                # Limit title length for display
+                display_title = title[:80] + '...' if len(title) > 80 else title
+                filtered_windows[hwnd] = (f"{hwnd}: {display_title}", title)
+        return filtered_windows
+
+    def _apply_window_list(self, filtered_windows, generation=None):
+        """Populates the combobox from the worker's results (Tk thread).
+
+        generation is the refresh that produced the list; results from a superseded
+        refresh are dropped so they cannot overwrite newer ones or reset the selection.
+        None (the synchronous startup population) always applies.
+        """
+        if generation is not None and generation != self._refresh_generation:
+            return
+        try:
+            window_titles = [display for display, _ in filtered_windows.values()]
+            self.window_titles = [title for _, title in filtered_windows.values()]
             self.window_handles = list(filtered_windows.keys()) # Store HWNDs in the same order
             self.window_combo['values'] = window_titles
+            self._last_selected_index = -1 # Indices refer to a new list now
 
             if window_titles:
                 last_hwnd = self.app.selected_hwnd
@@ -132,6 +210,7 @@ class CaptureTab(BaseTab):
                     try:
                         idx = self.window_handles.index(last_hwnd)
                         self.window_combo.current(idx)
+                        self._last_selected_index = idx
                         # No need to call on_window_selected here, just restore state
                     except ValueError:
                         # Handle case where HWND exists but somehow index fails (shouldn't happen)
@@ -148,27 +227,35 @@ class CaptureTab(BaseTab):
                     self.app.selected_hwnd = None
                     self.app.load_rois_for_hwnd(None)
 
-            self.window_combo.config(state="readonly") # Set back to readonly after update
+            if not self.app.capturing: # Selection stays locked while capturing
+                self.window_combo.config(state="readonly") # Set back to readonly after update
 
         except Exception as e:
-            self.app.update_status(f"Error refreshing windows: {e}")
+            self._on_refresh_error(str(e))
+
+    def _on_refresh_error(self, message, generation=None):
+        if generation is not None and generation != self._refresh_generation:
+            return # A newer refresh is in flight
+        self.app.update_status(f"Error refreshing windows: {message}")
+        if not self.app.capturing: # Selection stays locked while capturing
             self.window_combo.config(state="readonly") # Ensure readonly on error
 
     def on_window_selected(self, event=None):
+        selected_index = self.window_combo.current()
+        # Tk re-fires <<ComboboxSelected>> for unchanged selections; skip those
+        if selected_index == self._last_selected_index:
+            return
+        self._last_selected_index = selected_index
         try:
-            selected_index = self.window_combo.current()
             if 0 <= selected_index < len(self.window_handles):
                 new_hwnd = self.window_handles[selected_index]
                 if new_hwnd != self.app.selected_hwnd:
                     self.app.selected_hwnd = new_hwnd
-                    # Get full title for status, not truncated one from combobox if possible
-                    try:
-                        full_title = get_window_title(new_hwnd)
-                    except Exception:
-                        full_title = self.window_combo.get().split(":", 1)[-1].strip() # Fallback
+                    # Full title for status, not the truncated one from the combobox
+                    full_title = self.window_titles[selected_index]
 
                     self.app.update_status(f"Window selected: {full_title}")
-                    print(f"Selected window HWND: {self.app.selected_hwnd}")
+                    log.debug("Selected window HWND: %s", self.app.selected_hwnd)
                     # Load ROIs and context specific to this window
                     self.app.load_rois_for_hwnd(new_hwnd)
                     # If capture was running, maybe notify user to restart?
@@ -183,6 +270,7 @@ class CaptureTab(BaseTab):
         except Exception as e:
             # General error handling
             self.app.selected_hwnd = None
+            self._last_selected_index = -1 # Allow retrying the same entry
             self.app.update_status(f"Error selecting window: {e}")
             self.app.load_rois_for_hwnd(None)
 
@@ -190,8 +278,7 @@ class CaptureTab(BaseTab):
         """Handles selection of a new OCR engine."""
         new_engine = self.engine_var.get()
         if new_engine in self.OCR_ENGINES:
-            print(f"OCR Engine selection changed to: {new_engine}")
-            set_setting("ocr_engine", new_engine)
+            log.debug("OCR Engine selection changed to: %s", new_engine)
             # Trigger the app to update/initialize the selected engine
             # Pass the currently selected language as well
             current_lang = self.lang_var.get() or "jpn" # Use current lang or default
@@ -205,8 +292,7 @@ class CaptureTab(BaseTab):
         """Handles selection of a new OCR language."""
         new_lang = self.lang_var.get()
         if new_lang in self.OCR_LANGUAGES:
-            print(f"OCR Language changed to: {new_lang}")
-            set_setting("ocr_language", new_lang)
+            log.debug("OCR Language changed to: %s", new_lang)
             # Trigger the app to update the OCR engine with the new language
             # Pass the currently selected engine type
             current_engine = self.engine_var.get()
@@ -219,35 +305,43 @@ class CaptureTab(BaseTab):
         else:
             self.app.update_status("Invalid language selected.")
 
+    def _queue_settings_flush(self, *args):
+        """Schedules a single settings write for engine/language changes."""
+        if self._settings_after_id is not None:
+            try:
+                self.frame.after_cancel(self._settings_after_id)
+            except tk.TclError:
+                pass
+        self._settings_after_id = self.frame.after(200, self._flush_settings)
+
+    def _flush_settings(self):
+        """Writes the current OCR engine and language to settings in one save."""
+        self._settings_after_id = None
+        new_values = {}
+        engine = self.engine_var.get()
+        if engine in self.OCR_ENGINES:
+            new_values["ocr_engine"] = engine
+        lang = self.lang_var.get()
+        if lang in self.OCR_LANGUAGES:
+            new_values["ocr_language"] = lang
+        if new_values:
+            update_settings(new_values)
+
     def update_status(self, message):
         """Updates the status label text."""
         self.status_label.config(text=f"Status: {message}")
 
     # --- State Update Callbacks from App ---
     def on_capture_started(self):
-        self.start_btn.config(state=tk.DISABLED)
-        self.refresh_btn.config(state=tk.DISABLED)
-        self.window_combo.config(state=tk.DISABLED)
-        # Disable engine/lang changes while capturing
-        #self.engine_combo.config(state=tk.DISABLED)
-        #self.lang_combo.config(state=tk.DISABLED)
-        # Enable relevant buttons
-        self.stop_btn.config(state=tk.NORMAL)
-        self.snapshot_btn.config(state=tk.NORMAL)
-        self.live_view_btn.config(state=tk.DISABLED) # Cannot return to live if already live
+        self._apply_widget_states(self._capturing_states)
 
     def on_capture_stopped(self):
-        self.start_btn.config(state=tk.NORMAL)
-        self.refresh_btn.config(state=tk.NORMAL)
-        self.window_combo.config(state="readonly") # Re-enable selection
-        # Re-enable engine/lang changes
-        if self.OCR_ENGINES: # Only enable if engines are actually available
-            self.engine_combo.config(state="readonly")
-        self.lang_combo.config(state="readonly")
-        # Disable relevant buttons
-        self.stop_btn.config(state=tk.DISABLED)
-        self.snapshot_btn.config(state=tk.DISABLED) # Cannot snapshot if not capturing
-        self.live_view_btn.config(state=tk.DISABLED)
+        self._apply_widget_states(self._stopped_states)
+
+    def _apply_widget_states(self, states):
+        """Applies a list of (widget, ttk state flags) pairs, one Tcl call per widget."""
+        for widget, flags in states:
+            widget.state(flags)
 
     def on_snapshot_taken(self):
         # Snapshot implies capture was running, so keep stop/snapshot enabled
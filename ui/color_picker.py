@@ -1,9 +1,38 @@
 # --- START OF FILE ui/color_picker.py ---
 
+import logging
+import sys
 import tkinter as tk
 import mss
-import numpy as np
-# import cv2 # Not needed if mss provides RGB directly or we handle BGRA
+
+log = logging.getLogger(__name__)
+
+CLR_INVALID = 0xFFFFFFFF # GetPixel failure value
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # Private handles so the prototypes below do not leak into ctypes.windll users.
+    # Without a restype GetPixel's DWORD comes back as a signed int (CLR_INVALID -> -1)
+    # and GetDC's handle is truncated to 32 bits on 64-bit Python.
+    _user32 = ctypes.WinDLL("user32")
+    _gdi32 = ctypes.WinDLL("gdi32")
+    _user32.GetDC.argtypes = (wintypes.HWND,)
+    _user32.GetDC.restype = wintypes.HDC
+    _user32.ReleaseDC.argtypes = (wintypes.HWND, wintypes.HDC)
+    _user32.ReleaseDC.restype = ctypes.c_int
+    _gdi32.GetPixel.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int)
+    _gdi32.GetPixel.restype = wintypes.DWORD
+
+_sct = None # Shared mss instance; picks all happen on the Tk thread
+
+def _get_sct():
+    """Returns the shared mss instance, creating it on first use."""
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct
 
 class ScreenColorPicker:
     """Handles capturing a color from anywhere on the screen."""
@@ -16,7 +45,7 @@ class ScreenColorPicker:
     def grab_color(self, callback):
         """Creates the overlay and starts the color picking process."""
         if self.overlay and self.overlay.winfo_exists():
-            print("Color picker already active.")
+            log.debug("Color picker already active.")
             # Optionally bring existing picker to front? Or just ignore.
             # self.overlay.lift()
             return
@@ -29,16 +58,18 @@ class ScreenColorPicker:
             self.overlay.overrideredirect(True)
             self.overlay.attributes("-topmost", True)
             self.overlay.configure(cursor="crosshair")
-            self.overlay.grab_set()
+            # No grab_set: the topmost fullscreen overlay already receives the click,
+            # and a global grab would route every input event through this window.
 
             self.overlay.bind("<ButtonPress-1>", self._on_click)
-            self.overlay.bind("<Escape>", self._on_cancel)
+            # Bound on "all" so Escape still cancels if the overlay loses focus
+            self.overlay.bind_all("<Escape>", self._on_cancel)
 
             # Focus the overlay window to ensure it receives key events like Escape
             self.overlay.focus_force()
 
         except Exception as e:
-            print(f"Error creating color picker overlay: {e}")
+            log.error("Error creating color picker overlay: %s", e)
             self._cleanup()
             if self.callback:
                 self.callback(None)
@@ -46,49 +77,19 @@ class ScreenColorPicker:
     def _on_click(self, event):
         """Callback when the user clicks on the overlay."""
         x, y = event.x_root, event.y_root
-        print(f"Color picker clicked at screen coordinates: ({x}, {y})")
+        log.debug("Color picker clicked at screen coordinates: (%s, %s)", x, y)
 
         # --- Critical Change: Destroy overlay BEFORE capture ---
-        # Release grab and destroy the overlay window immediately
-        # so it doesn't interfere with the mss capture.
-        if self.overlay and self.overlay.winfo_exists():
-            try:
-                self.overlay.grab_release()
-                self.overlay.destroy()
-            except tk.TclError: pass # Ignore if already gone
-        self.overlay = None # Mark as destroyed
+        # Destroy the overlay window immediately
+        # so it doesn't interfere with the pixel capture.
+        self._cleanup()
         # ---
 
         color_rgb = None
-        try:
-            # Define the 1x1 pixel region to capture at the click coordinates
-            monitor = {"top": y, "left": x, "width": 1, "height": 1}
-
-            # Use mss to capture the screen pixel *after* overlay is gone
-            with mss.mss() as sct:
-                sct_img = sct.grab(monitor)
-
-            # Convert the raw BGRA data to a NumPy array
-            # mss returns RGB data in monitor dict mode, BGRA in tuple mode?
-            # Let's assume BGRA for safety and convert.
-            img_array = np.array(sct_img, dtype=np.uint8)
-
-            # Extract the single pixel's color
-            if img_array.size >= 3:
-                # Assuming BGRA format from mss raw capture
-                b, g, r = img_array[0, 0][:3] # Take first 3 channels (ignore alpha)
-                color_rgb = (int(r), int(g), int(b)) # Convert to RGB tuple
-                print(f"Picked color (RGB): {color_rgb}")
-            else:
-                print("Error: Captured image data is too small or invalid.")
-
-        except mss.ScreenShotError as sct_err:
-            print(f"Error capturing screen color with mss: {sct_err}")
-        except Exception as e:
-            print(f"Error processing captured screen color: {e}")
-            import traceback
-            traceback.print_exc()
-
+        if sys.platform == "win32":
+            color_rgb = self._grab_pixel_win32(x, y)
+        if color_rgb is None:
+            color_rgb = self._grab_pixel_mss(x, y)
 
         # Call the original callback with the result (color_rgb or None)
         if self.callback:
@@ -96,25 +97,65 @@ class ScreenColorPicker:
             try:
                 self.callback(color_rgb)
             except Exception as cb_err:
-                print(f"Error executing color picker callback: {cb_err}")
+                log.error("Error executing color picker callback: %s", cb_err)
         self.callback = None # Prevent multiple calls
 
+    def _grab_pixel_win32(self, x, y):
+        """Reads a single pixel from the desktop DC with GetPixel, returning RGB or None."""
+        try:
+            hdc = _user32.GetDC(None)
+            if not hdc:
+                return None
+            try:
+                cref = _gdi32.GetPixel(hdc, x, y)
+            finally:
+                _user32.ReleaseDC(None, hdc)
+            if cref == CLR_INVALID:
+                return None
+            # COLORREF is 0x00BBGGRR
+            color_rgb = (cref & 0xFF, (cref >> 8) & 0xFF, (cref >> 16) & 0xFF)
+            log.debug("Picked color (RGB): %s", color_rgb)
+            return color_rgb
+        except Exception as e:
+            log.warning("GetPixel failed, falling back to mss: %s", e)
+            return None
+
+    def _grab_pixel_mss(self, x, y):
+        """Captures a single screen pixel with mss, returning an RGB tuple or None."""
+        color_rgb = None
+        try:
+            # Define the 1x1 pixel region to capture at the click coordinates
+            monitor = {"top": y, "left": x, "width": 1, "height": 1}
+
+            # Use mss to capture the screen pixel *after* overlay is gone
+            sct_img = _get_sct().grab(monitor)
+
+            # mss decodes BGRA itself; pixel() returns an (R, G, B) tuple
+            color_rgb = tuple(sct_img.pixel(0, 0))
+            log.debug("Picked color (RGB): %s", color_rgb)
+
+        except mss.ScreenShotError as sct_err:
+            log.error("Error capturing screen color with mss: %s", sct_err)
+        except Exception as e:
+            log.exception("Error processing captured screen color: %s", e)
+        return color_rgb
+
     def _on_cancel(self, event=None):
         """Callback when the user presses Escape."""
-        print("Color picking cancelled.")
+        log.debug("Color picking cancelled.")
         self._cleanup() # Destroy overlay
         if self.callback:
             try:
                 self.callback(None) # Notify callback of cancellation
             except Exception as cb_err:
-                print(f"Error executing cancellation callback: {cb_err}")
+                log.error("Error executing cancellation callback: %s", cb_err)
         self.callback = None
 
     def _cleanup(self):
-        """Destroys the overlay window and releases grab if necessary."""
+        """Destroys the overlay window and removes the Escape binding."""
         if self.overlay and self.overlay.winfo_exists():
             try:
-                self.overlay.grab_release()
+                self.overlay.unbind_all("<Escape>")
                 self.overlay.destroy()
             except tk.TclError:
                 pass
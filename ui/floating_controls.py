@@ -1,15 +1,65 @@
+import logging
+import re
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog # Keep simpledialog just in case? No, remove if not used.
-import pyperclip
 from utils.settings import get_setting, set_setting
 
+log = logging.getLogger(__name__)
+
+# Legacy saved position format: "x,y" (current format is an [x, y] list)
+_POS_RE = re.compile(r"(-?\d+),(-?\d+)")
+
+# Upper bound on the controls bar size at 100% scaling (scaled by tk scaling at use)
+_MAX_BAR_W, _MAX_BAR_H = 480, 80
+
+# Placeholder results that are never copied to the clipboard
+_SKIP_TRANSLATIONS = frozenset({"[Translation Missing]", "[Translation N/A]"})
+
+def _parse_saved_pos(value):
+    """Returns the saved controls position as (x, y), or None if missing or malformed.
+
+    Accepts the current [x, y] list and the legacy "x,y" string; the next save
+    rewrites legacy values as a list.
+    """
+    if isinstance(value, (list, tuple)):
+        if len(value) == 2 and all(type(v) is int for v in value):
+            return value[0], value[1]
+        return None
+    if isinstance(value, str):
+        m = _POS_RE.fullmatch(value)
+        if m:
+            return int(m.group(1)), int(m.group(2))
+    return None
+
+_styles_configured = False
+
+def _configure_styles(root):
+    """Registers the floating controls' ttk styles once per process.
+
+    ttk styles are global to the interpreter, so reopening the window reuses them.
+    """
+    global _styles_configured
+    if _styles_configured:
+        return
+    style = ttk.Style(root)
+    style.configure("Floating.TButton", padding=2, font=('Segoe UI', 8))
+    style.configure("Toolbutton.TCheckbutton", padding=3, font=('Segoe UI', 10), indicatoron=False,
+                    foreground='black')
+    style.map("Toolbutton.TCheckbutton",
+              background=[('selected', '#CCCCCC'), ('!selected', '#E0E0E0')])
+    _styles_configured = True
+
 # --- Custom Dialog for Multiline Input ---
 class MultilineInputDialog(tk.Toplevel):
-    def __init__(self, parent, title=None, prompt=None):
+    """Non-blocking multiline prompt; on_done(result) is called on OK (text) or Cancel (None)."""
+    def __init__(self, parent, title=None, prompt=None, on_done=None):
         super().__init__(parent)
         self.transient(parent)
         self.parent = parent
         self.result = None # Store the result here
+        self._on_done = on_done
 
         if title:
             self.title(title)
@@ -36,365 +86,461 @@ class MultilineInputDialog(tk.Toplevel):
         cancel_button = ttk.Button(button_frame, text="Cancel", width=10, command=self.on_cancel)
         cancel_button.pack(side=tk.RIGHT)
 
-        # Make dialog modal
-        self.grab_set()
+        # No grab or wait_window: the rest of the app keeps handling events while this is open
         self.protocol("WM_DELETE_WINDOW", self.on_cancel)
         self.geometry("+%d+%d" % (parent.winfo_rootx()+50, parent.winfo_rooty()+50))
         self.text_widget.focus_set()
 
-        # Wait for the dialog to close
-        self.wait_window(self)
-
     def on_ok(self, event=None):
-        self.result = self.text_widget.get("1.0", tk.END).strip()
-        self.destroy()
+        # "end-1c" excludes the Text widget's implicit trailing newline
+        self.result = self.text_widget.get("1.0", "end-1c").strip()
+        self._finish()
 
     def on_cancel(self, event=None):
         self.result = None # Indicate cancellation
+        self._finish()
+
+    def _finish(self):
         self.destroy()
+        if self._on_done:
+            self._on_done(self.result)
 
 # --- Floating Controls Window ---
 class FloatingControls(tk.Toplevel):
     """A small, draggable, topmost window for quick translation actions."""
+
+    # Controls laid out left to right:
+    # (attribute, text, width, command, toggle variable or None, horizontal padding, tooltip)
+    _BUTTONS = (
+        ("retranslate_btn", "🔄", 3, "translation_tab.perform_translation", None, 2,
+         "Re-translate (use cache)"),
+        ("force_retranslate_btn", "⚡", 3, "translation_tab.perform_force_translation", None, 2,
+         "Force re-translate & update cache"),
+        ("translate_comment_btn", "💬🔄", 4, "translate_with_comment", None, 2,
+         "Translate with Comment (use cache)"),
+        ("force_translate_comment_btn", "💬⚡", 4, "force_translate_with_comment", None, 2,
+         "Force re-translate with Comment & update cache"),
+        ("copy_btn", "📋", 3, "copy_last_translation", None, 2, "Copy last translation(s)"),
+        ("snip_btn", "✂️", 3, "start_snip_mode", None, 2, "Snip & Translate Region"),
+        ("auto_btn", "🤖", 3, "toggle_auto_translate", "auto_var", 2, "Toggle Auto-Translate"),
+        ("overlay_btn", "👁️", 3, "toggle_overlays", "overlay_var", 2, "Show/Hide Overlays"),
+        ("close_btn", "✕", 2, "withdraw", None, (5, 2), "Hide Controls"),
+    )
+    _pyperclip = None # Imported on first copy
+
     def __init__(self, master, app_ref):
         super().__init__(master)
         self.app = app_ref
+        # Resolve app components once; they are stable for the app's lifetime
+        self._translation_tab = getattr(self.app, 'translation_tab', None)
+        self._overlay_manager = getattr(self.app, 'overlay_manager', None)
         self.overrideredirect(True)
         self.wm_attributes("-topmost", True)
+        if sys.platform == "win32":
+            # A non-opaque alpha makes this a layered window that DWM composites
+            # directly, so moving it while dragging does not trigger a full repaint
+            self.wm_attributes("-alpha", 0.99)
         self.title("Controls")
-        self._offset_x = 0
-        self._offset_y = 0
-        self.bind("<ButtonPress-1>", self.on_press)
-        self.bind("<B1-Motion>", self.on_drag)
-        self.bind("<ButtonRelease-1>", self.on_release)
+        self._drag_origin = (0, 0, 0, 0) # Window x/y and pointer x_root/y_root at press
+        self._pending_geom = None # Latest drag target not yet applied
+        self._drag_after_id = None # Pending frame flush while dragging
+        self._last_x = self._last_y = None # Last position applied by a drag
+        self._tk_call = self.tk.call
+        self._save_after_id = None # Pending debounced position save
+        self._pending_pos = None # Position waiting to be saved
+        self._req_w = self._req_h = None # Cached sizes, filled by _ensure_sized()
+        self._scr_w = self._scr_h = None
+        self._comment_dialog = None # Open MultilineInputDialog, if any
         self.configure(background='#ECECEC')
-        style = ttk.Style(self)
-        style.configure("Floating.TButton", padding=2, font=('Segoe UI', 8))
-        style.configure("Toolbutton.TCheckbutton", padding=3, font=('Segoe UI', 10), indicatoron=False)
-        style.map("Toolbutton.TCheckbutton",
-                  background=[('selected', '#CCCCCC'), ('!selected', '#E0E0E0')],
-                  foreground=[('selected', 'black'), ('!selected', 'black')])
+        self._tt_mgr = TooltipManager(self)
+        _configure_styles(self)
+
+        # Drag handle: drag events are bound here only, so button clicks never hit the drag path
+        self.drag_handle = tk.Frame(self, height=6, cursor="fleur", background='#C8C8C8')
+        self.drag_handle.pack(side=tk.TOP, fill=tk.X)
+        self.drag_handle.bind("<ButtonPress-1>", self.on_press)
+        self.drag_handle.bind("<B1-Motion>", self.on_drag)
+        self.drag_handle.bind("<ButtonRelease-1>", self.on_release)
 
         button_frame = ttk.Frame(self, padding=5)
         button_frame.pack(fill=tk.BOTH, expand=True)
 
-        col_index = 0
-
-        # Retranslate
-        self.retranslate_btn = ttk.Button(button_frame, text="🔄", width=3, style="Floating.TButton",
-                                          command=self.app.translation_tab.perform_translation)
-        self.retranslate_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.retranslate_btn, "Re-translate (use cache)")
-        col_index += 1
-
-        # Force Retranslate
-        self.force_retranslate_btn = ttk.Button(button_frame, text="⚡", width=3, style="Floating.TButton",
-                                                command=self.app.translation_tab.perform_force_translation)
-        self.force_retranslate_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.force_retranslate_btn, "Force re-translate & update cache")
-        col_index += 1
-
-        # Translate with Comment (NEW)
-        self.translate_comment_btn = ttk.Button(button_frame, text="💬🔄", width=4, style="Floating.TButton",
-                                                command=self.translate_with_comment)
-        self.translate_comment_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.translate_comment_btn, "Translate with Comment (use cache)")
-        col_index += 1
-
-        # Force Retranslate with Comment (NEW)
-        self.force_translate_comment_btn = ttk.Button(button_frame, text="💬⚡", width=4, style="Floating.TButton",
-                                                      command=self.force_translate_with_comment)
-        self.force_translate_comment_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.force_translate_comment_btn, "Force re-translate with Comment & update cache")
-        col_index += 1
-
-        # Copy
-        self.copy_btn = ttk.Button(button_frame, text="📋", width=3, style="Floating.TButton",
-                                   command=self.copy_last_translation)
-        self.copy_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.copy_btn, "Copy last translation(s)")
-        col_index += 1
-
-        # Snip
-        self.snip_btn = ttk.Button(button_frame, text="✂️", width=3, style="Floating.TButton",
-                                   command=self.start_snip_mode)
-        self.snip_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.snip_btn, "Snip & Translate Region")
-        col_index += 1
-
-        # Auto-Translate Toggle
+        # Toggle states mirror the main app at open time
         initial_auto_state = False
-        if hasattr(self.app, 'translation_tab') and self.app.translation_tab:
-            initial_auto_state = self.app.translation_tab.is_auto_translate_enabled()
+        if self._translation_tab is not None:
+            initial_auto_state = self._translation_tab.is_auto_translate_enabled()
         self.auto_var = tk.BooleanVar(value=initial_auto_state)
-        self.auto_btn = ttk.Checkbutton(button_frame, text="🤖", style="Toolbutton.TCheckbutton",
-                                        variable=self.auto_var, command=self.toggle_auto_translate,
-                                        width=3)
-        self.auto_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.auto_btn, "Toggle Auto-Translate")
-        col_index += 1
-
-        # Overlay Toggle
         initial_overlay_state = True
-        if hasattr(self.app, 'overlay_manager') and self.app.overlay_manager:
-            initial_overlay_state = self.app.overlay_manager.global_overlays_enabled
+        if self._overlay_manager is not None:
+            initial_overlay_state = self._overlay_manager.global_overlays_enabled
         self.overlay_var = tk.BooleanVar(value=initial_overlay_state)
-        self.overlay_btn = ttk.Checkbutton(button_frame, text="👁️", style="Toolbutton.TCheckbutton",
-                                           variable=self.overlay_var, command=self.toggle_overlays,
-                                           width=3)
-        self.overlay_btn.grid(row=0, column=col_index, padx=2, pady=2)
-        self.add_tooltip(self.overlay_btn, "Show/Hide Overlays")
-        col_index += 1
-
-        # Close Button
-        self.close_btn = ttk.Button(button_frame, text="✕", width=2, style="Floating.TButton",
-                                    command=self.withdraw)
-        self.close_btn.grid(row=0, column=col_index, padx=(5, 2), pady=2)
-        self.add_tooltip(self.close_btn, "Hide Controls")
+
+        for col_index, (attr, text, width, cmd, var_name, padx, tip) in enumerate(self._BUTTONS):
+            command = self._resolve_cmd(cmd)
+            if var_name:
+                widget = ttk.Checkbutton(button_frame, text=text, width=width, style="Toolbutton.TCheckbutton",
+                                         variable=getattr(self, var_name), command=command)
+            else:
+                widget = ttk.Button(button_frame, text=text, width=width, style="Floating.TButton",
+                                    command=command)
+            widget.grid(row=0, column=col_index, padx=padx, pady=2)
+            self.add_tooltip(widget, tip)
+            setattr(self, attr, widget)
 
         # Positioning
         saved_pos = get_setting("floating_controls_pos")
-        if saved_pos:
-            try:
-                x, y = map(int, saved_pos.split(','))
-                self.update_idletasks()
-                win_width = self.winfo_reqwidth()
-                win_height = self.winfo_reqheight()
-                screen_width = self.winfo_screenwidth()
-                screen_height = self.winfo_screenheight()
-                if 0 <= x <= screen_width - win_width and 0 <= y <= screen_height - win_height:
+        pos = _parse_saved_pos(saved_pos)
+        if pos:
+            x, y = pos
+            self._scr_w = self.winfo_screenwidth()
+            self._scr_h = self.winfo_screenheight()
+            # A position that fits even the largest possible bar needs no layout pass.
+            # Fonts grow with DPI, so scale the bound by tk scaling (96/72 at 100%).
+            scale = max(1.0, float(self.tk.call("tk", "scaling")) / (96 / 72))
+            max_w, max_h = int(_MAX_BAR_W * scale), int(_MAX_BAR_H * scale)
+            if 0 <= x <= self._scr_w - max_w and 0 <= y <= self._scr_h - max_h:
+                self.geometry(f"+{x}+{y}")
+            else:
+                self._ensure_sized()
+                max_x = self._scr_w - self._req_w
+                max_y = self._scr_h - self._req_h
+                if 0 <= x <= max_x and 0 <= y <= max_y:
                     self.geometry(f"+{x}+{y}")
                 else:
-                    print("Saved floating controls position out of bounds, centering.")
+                    log.info("Saved floating controls position out of bounds, centering.")
                     self.center_window()
-            except Exception as e:
-                print(f"Error parsing saved position '{saved_pos}': {e}. Centering window.")
-                self.center_window()
         else:
+            if saved_pos:
+                log.warning("Ignoring malformed saved position '%s'. Centering window.", saved_pos)
             self.center_window()
 
         self.master.after_idle(self.update_button_states)
         self.deiconify()
 
+    def _resolve_cmd(self, name):
+        """Resolves a _BUTTONS command name to a bound method here or on the translation tab."""
+        if name.startswith("translation_tab."):
+            return getattr(self._translation_tab, name.partition(".")[2])
+        return getattr(self, name)
+
+    def _ensure_sized(self):
+        """Measures the window once and caches requested and screen sizes.
+
+        update_idletasks() is the only synchronous flush used in this window;
+        update() would also process pending input events and can re-enter handlers.
+        """
+        if self._req_w is not None:
+            return
+        self.update_idletasks()
+        self._req_w = self.winfo_reqwidth()
+        self._req_h = self.winfo_reqheight()
+        self._scr_w = self.winfo_screenwidth()
+        self._scr_h = self.winfo_screenheight()
+
     def center_window(self):
         try:
-            self.update_idletasks()
-            width = self.winfo_reqwidth()
-            screen_width = self.winfo_screenwidth()
-            x = (screen_width // 2) - (width // 2)
+            self._ensure_sized()
+            x = (self._scr_w // 2) - (self._req_w // 2)
             y = 10
             self.geometry(f'+{x}+{y}')
         except Exception as e:
-            print(f"Error centering floating controls: {e}")
+            log.error("Error centering floating controls: %s", e)
 
     def on_press(self, event):
-        self._offset_x = event.x
-        self._offset_y = event.y
+        self._drag_origin = (self.winfo_x(), self.winfo_y(), event.x_root, event.y_root)
+        self._last_x = self._last_y = None # Window may have moved since the last drag
 
     def on_drag(self, event):
-        new_x = self.winfo_x() + event.x - self._offset_x
-        new_y = self.winfo_y() + event.y - self._offset_y
-        self.geometry(f"+{new_x}+{new_y}")
+        # Pure delta arithmetic from the press origin; no winfo_* queries per motion event
+        origin_x, origin_y, start_x, start_y = self._drag_origin
+        new_x = origin_x + event.x_root - start_x
+        new_y = origin_y + event.y_root - start_y
+        # Coalesce motion events: only the latest position is applied, once per frame
+        self._pending_geom = (new_x, new_y)
+        if self._drag_after_id is None:
+            self._drag_after_id = self.after(16, self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_after_id = None
+        pending = self._pending_geom
+        self._pending_geom = None
+        if pending:
+            self._move_to(*pending)
+
+    def _move_to(self, x, y):
+        if x == self._last_x and y == self._last_y:
+            return # Zero delta; skip the window manager round trip
+        try:
+            # Straight to Tcl, skipping the Misc.wm_geometry wrapper on the motion path
+            self._tk_call("wm", "geometry", self._w, "+%d+%d" % (x, y))
+            self._last_x, self._last_y = x, y
+        except tk.TclError:
+            pass # Window destroyed mid-drag
 
     def on_release(self, event):
+        # Apply any throttled drag position first so the saved value is final
+        if self._drag_after_id is not None:
+            self.after_cancel(self._drag_after_id)
+            self._flush_drag()
+        if self._last_x is not None:
+            # winfo_x/y lags the geometry just applied by _move_to until the WM catches up
+            self._schedule_save(self._last_x, self._last_y)
+            return
+        try:
+            self._schedule_save(self.winfo_x(), self.winfo_y())
+        except tk.TclError:
+            pass # Window destroyed mid-drag
+
+    def _schedule_save(self, x, y):
+        """Debounces position saves: quick successive drags only write the final position."""
+        self._pending_pos = (x, y)
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(500, self._flush_pos)
+
+    def _flush_pos(self):
+        """Writes the pending position to settings, if any."""
+        if self._save_after_id is not None:
+            try:
+                self.after_cancel(self._save_after_id)
+            except tk.TclError:
+                pass
+            self._save_after_id = None
+        pending = self._pending_pos
+        self._pending_pos = None
+        if pending is None:
+            return
         try:
-            x = self.winfo_x()
-            y = self.winfo_y()
-            set_setting("floating_controls_pos", f"{x},{y}")
+            set_setting("floating_controls_pos", list(pending))
         except Exception as e:
-            print(f"Error saving floating controls position: {e}")
+            log.error("Error saving floating controls position: %s", e)
+
+    def destroy(self):
+        self._flush_pos() # Persist a position still waiting on the debounce
+        super().destroy()
 
     def copy_last_translation(self):
-        if not hasattr(self.app, 'translation_tab') or not hasattr(self.app.translation_tab, 'last_translation_result'):
+        if self._translation_tab is None:
             self.app.update_status("No translation available.")
             return
-        last_result = getattr(self.app.translation_tab, 'last_translation_result', None)
+        last_result = getattr(self._translation_tab, 'last_translation_result', None)
         if last_result and isinstance(last_result, dict):
-            copy_text = ""
-            rois_to_iterate = self.app.rois if hasattr(self.app, 'rois') else []
-            for roi in rois_to_iterate:
-                roi_name = roi.name
-                if roi_name in last_result:
-                    translation = last_result[roi_name]
-                    if translation and translation not in ["[Translation Missing]", "[Translation N/A]"]:
-                        if copy_text:
-                            copy_text += "\n\n"
-                        copy_text += translation
+            # Collect in ROI order and join once (no repeated string concatenation)
+            get = last_result.get
+            parts = [t for roi in self.app.rois or ()
+                     if (t := get(roi.name)) and t not in _SKIP_TRANSLATIONS]
+            copy_text = "\n\n".join(parts)
             if copy_text:
-                try:
-                    pyperclip.copy(copy_text)
-                    print("Last translation copied to clipboard.")
-                    self.app.update_status("Translation copied.")
-                except pyperclip.PyperclipException as e:
-                    print(f"Pyperclip Error: {e}")
-                    self.app.update_status("Error: Could not copy (Pyperclip).")
-                    messagebox.showerror("Clipboard Error", f"Could not copy text to clipboard.\nPyperclip error: {e}", parent=self)
-                except Exception as e:
-                    print(f"Error copying to clipboard: {e}")
-                    self.app.update_status("Error copying translation.")
+                # Clipboard backends can block (subprocess/WinAPI); copy off the Tk thread
+                threading.Thread(target=self._do_copy, args=(copy_text,), daemon=True).start()
             else:
                 self.app.update_status("No translation to copy.")
         else:
             self.app.update_status("No translation to copy.")
 
+    def _do_copy(self, copy_text):
+        """Worker: copies text to the clipboard and reports back on the Tk thread."""
+        pyperclip = FloatingControls._pyperclip
+        if pyperclip is None:
+            try:
+                import pyperclip # Deferred: only loaded on first copy
+            except ImportError as e:
+                log.error("Pyperclip not available: %s", e)
+                self.master.after_idle(lambda: self.app.update_status("Error: Clipboard support not installed."))
+                return
+            FloatingControls._pyperclip = pyperclip
+        try:
+            pyperclip.copy(copy_text)
+            log.debug("Last translation copied to clipboard.")
+            self.master.after_idle(lambda: self.app.update_status("Translation copied."))
+        except pyperclip.PyperclipException as e:
+            log.error("Pyperclip Error: %s", e)
+            self.master.after_idle(lambda msg=str(e): self._on_copy_error(msg))
+        except Exception as e:
+            log.error("Error copying to clipboard: %s", e)
+            self.master.after_idle(lambda: self.app.update_status("Error copying translation."))
+
+    def _on_copy_error(self, message):
+        self.app.update_status("Error: Could not copy (Pyperclip).")
+        messagebox.showerror("Clipboard Error", f"Could not copy text to clipboard.\nPyperclip error: {message}", parent=self)
+
     def start_snip_mode(self):
         if hasattr(self.app, 'start_snip_mode'):
             self.app.start_snip_mode()
         else:
-            print("Error: Snip mode function not found in main app.")
+            log.error("Snip mode function not found in main app.")
             messagebox.showerror("Error", "Snip & Translate feature not available.", parent=self)
 
-    def _get_multiline_comment(self, title, prompt):
-        """Opens a custom dialog for multiline comment input."""
-        dialog = MultilineInputDialog(self, title=title, prompt=prompt)
-        # The dialog's result is stored in dialog.result after it closes
-        return dialog.result
+    def _prompt_comment(self, title, on_done):
+        """Opens the multiline comment dialog; on_done(comment) runs when it closes.
 
-    def translate_with_comment(self):
-        """Prompts for a multiline comment and starts translation (using cache)."""
-        comment = self._get_multiline_comment("Translate with Comment", "Enter a comment to guide the translation:")
-        if comment is None: # User cancelled
-            self.app.update_status("Translation with comment cancelled.")
+        Only one comment dialog is open at a time; a repeat request raises the existing one.
+        """
+        dialog = self._comment_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.lift()
+            dialog.text_widget.focus_set()
             return
-        # comment is already stripped by the dialog
 
-        if hasattr(self.app, 'translation_tab') and hasattr(self.app.translation_tab, 'perform_translation_with_comment'):
-            self.app.translation_tab.perform_translation_with_comment(comment, force_recache=False)
-        else:
-            print("Error: Translation tab or comment function not found.")
-            messagebox.showerror("Error", "Translate with comment feature not available.", parent=self)
+        def done(comment):
+            self._comment_dialog = None
+            on_done(comment)
+
+        self._comment_dialog = MultilineInputDialog(self, title=title,
+                                                    prompt="Enter a comment to guide the translation:",
+                                                    on_done=done)
+
+    def translate_with_comment(self):
+        """Prompts for a multiline comment and starts translation (using cache)."""
+        self._prompt_comment("Translate with Comment",
+                             lambda comment: self._on_comment_entered(comment, force_recache=False))
 
     def force_translate_with_comment(self):
         """Prompts for a multiline comment and starts force re-translation."""
-        comment = self._get_multiline_comment("Force Translate with Comment", "Enter a comment to guide the translation:")
+        self._prompt_comment("Force Translate with Comment",
+                             lambda comment: self._on_comment_entered(comment, force_recache=True))
+
+    def _on_comment_entered(self, comment, force_recache):
         if comment is None: # User cancelled
-            self.app.update_status("Force translation with comment cancelled.")
+            if force_recache:
+                self.app.update_status("Force translation with comment cancelled.")
+            else:
+                self.app.update_status("Translation with comment cancelled.")
             return
         # comment is already stripped by the dialog
 
-        if hasattr(self.app, 'translation_tab') and hasattr(self.app.translation_tab, 'perform_translation_with_comment'):
-            self.app.translation_tab.perform_translation_with_comment(comment, force_recache=True)
+        if self._translation_tab is not None:
+            self._translation_tab.perform_translation_with_comment(comment, force_recache=force_recache)
         else:
-            print("Error: Translation tab or comment function not found.")
-            messagebox.showerror("Error", "Force translate with comment feature not available.", parent=self)
+            log.error("Translation tab or comment function not found.")
+            feature = "Force translate with comment" if force_recache else "Translate with comment"
+            messagebox.showerror("Error", f"{feature} feature not available.", parent=self)
 
     def toggle_auto_translate(self):
-        if not hasattr(self.app, 'translation_tab') or not self.app.translation_tab:
-            print("Error: Translation tab not found.")
+        if self._translation_tab is None:
+            log.error("Translation tab not found.")
             self.auto_var.set(not self.auto_var.get())
             return
         try:
             is_enabled_now = self.auto_var.get()
-            print(f"Floating controls: Setting auto-translate to: {is_enabled_now}")
-            self.app.translation_tab.auto_translate_var.set(is_enabled_now)
-            self.app.translation_tab.toggle_auto_translate()
+            log.debug("Floating controls: Setting auto-translate to: %s", is_enabled_now)
+            self._translation_tab.toggle_auto_translate(is_enabled_now)
         except Exception as e:
-            print(f"Error invoking main auto-translate toggle: {e}")
+            log.error("Error invoking main auto-translate toggle: %s", e)
             try:
                 self.auto_var.set(not is_enabled_now)
             except Exception:
                 pass
 
     def toggle_overlays(self):
-        if not hasattr(self.app, 'overlay_manager') or not self.app.overlay_manager:
-            print("Error: Overlay manager not found.")
+        if self._overlay_manager is None:
+            log.error("Overlay manager not found.")
             self.overlay_var.set(not self.overlay_var.get())
             return
         try:
             new_state = self.overlay_var.get()
-            print(f"Floating controls: Setting global overlays to: {new_state}")
-            self.app.overlay_manager.set_global_overlays_enabled(new_state)
+            log.debug("Floating controls: Setting global overlays to: %s", new_state)
+            self._overlay_manager.set_global_overlays_enabled(new_state)
         except Exception as e:
-            print(f"Error invoking overlay manager toggle: {e}")
+            log.error("Error invoking overlay manager toggle: %s", e)
             try:
                 self.overlay_var.set(not new_state)
             except Exception:
                 pass
 
     def update_button_states(self):
+        # No winfo_exists() probes: a window torn down mid-update surfaces as TclError below
         try:
-            if hasattr(self.app, 'translation_tab') and self.app.translation_tab and hasattr(self, 'auto_var') and self.auto_var:
-                if self.auto_btn.winfo_exists():
-                    self.auto_var.set(self.app.translation_tab.is_auto_translate_enabled())
-            if hasattr(self.app, 'overlay_manager') and self.app.overlay_manager and hasattr(self, 'overlay_var') and self.overlay_var:
-                if self.overlay_btn.winfo_exists():
-                    self.overlay_var.set(self.app.overlay_manager.global_overlays_enabled)
+            # Only write on change so no-op refreshes do not fire variable traces
+            if self._translation_tab is not None:
+                new_auto = self._translation_tab.is_auto_translate_enabled()
+                if self.auto_var.get() != new_auto:
+                    self.auto_var.set(new_auto)
+            if self._overlay_manager is not None:
+                new_overlay = self._overlay_manager.global_overlays_enabled
+                if self.overlay_var.get() != new_overlay:
+                    self.overlay_var.set(new_overlay)
         except tk.TclError:
-            print("Warning: TclError during floating controls state update (widgets closing?).")
+            log.warning("TclError during floating controls state update (widgets closing?).")
         except Exception as e:
-            print(f"Error updating floating control states: {e}")
+            log.error("Error updating floating control states: %s", e)
 
     def add_tooltip(self, widget, text):
-        Tooltip(widget, text)
-
-class Tooltip:
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tipwindow = None
-        self.id = None
-        self.enter_id = None
-        self.leave_id = None
-        self.widget.bind("<Enter>", self.schedule_show, add='+')
-        self.widget.bind("<Leave>", self.schedule_hide, add='+')
-        self.widget.bind("<ButtonPress>", self.force_hide, add='+')
-
-    def schedule_show(self, event=None):
-        self.unschedule()
-        self.enter_id = self.widget.after(500, self.showtip)
-
-    def schedule_hide(self, event=None):
-        self.unschedule()
-        self.leave_id = self.widget.after(100, self.hidetip)
-
-    def unschedule(self):
-        enter_id = self.enter_id
-        self.enter_id = None
-        if enter_id:
-            try:
-                self.widget.after_cancel(enter_id)
-            except Exception:
-                pass
-        leave_id = self.leave_id
-        self.leave_id = None
-        if leave_id:
+        self._tt_mgr.register(widget, text)
+
+class TooltipManager:
+    """Shows tooltips for many widgets through one set of bindings and one tip window."""
+    BINDTAG = "FloatingTooltip"
+
+    def __init__(self, owner):
+        self.owner = owner
+        self._pending_id = None # Single show timer shared by all widgets
+        self._tipwindow = None
+        self._label = None
+        # Bound once on a shared bindtag instead of per widget
+        owner.bind_class(self.BINDTAG, "<Enter>", self._on_enter)
+        owner.bind_class(self.BINDTAG, "<Leave>", self._on_leave)
+        owner.bind_class(self.BINDTAG, "<ButtonPress>", self._on_leave)
+
+    def register(self, widget, text):
+        widget._tooltip_text = text # Read back by the shared handlers; no per-widget state
+        widget.bindtags(widget.bindtags() + (self.BINDTAG,))
+
+    def _on_enter(self, event):
+        self._unschedule()
+        self.hidetip()
+        if getattr(event.widget, "_tooltip_text", None):
+            widget = event.widget
+            self._pending_id = self.owner.after(500, lambda: self.showtip(widget))
+
+    def _on_leave(self, event=None):
+        self._unschedule()
+        self.hidetip()
+
+    def _unschedule(self):
+        pending_id = self._pending_id
+        self._pending_id = None
+        if pending_id:
             try:
-                self.widget.after_cancel(leave_id)
+                self.owner.after_cancel(pending_id)
             except Exception:
                 pass
 
-    def showtip(self):
-        self.unschedule()
-        if self.tipwindow or not self.text:
+    def showtip(self, widget):
+        self._pending_id = None
+        text = getattr(widget, "_tooltip_text", None)
+        if not text:
             return
         try:
-            if not self.widget.winfo_exists():
+            if not widget.winfo_exists():
                 return
-            x, y, _, _ = self.widget.bbox("insert")
-            x += self.widget.winfo_rootx() + 20
-            y += self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-            self.tipwindow = tw = tk.Toplevel(self.widget)
-            tw.wm_overrideredirect(True)
+            x = widget.winfo_rootx() + 20
+            y = widget.winfo_rooty() + widget.winfo_height() + 5
+            tw = self._get_tipwindow()
+            self._label.config(text=text)
             tw.wm_geometry(f"+{x}+{y}")
-            label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                             background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                             font=("tahoma", "8", "normal"), wraplength=200)
-            label.pack(ipadx=2, ipady=1)
+            tw.deiconify()
         except tk.TclError:
-            self.tipwindow = None
+            pass
         except Exception as e:
-            print(f"Error showing tooltip: {e}")
-            self.tipwindow = None
+            log.error("Error showing tooltip: %s", e)
+
+    def _get_tipwindow(self):
+        """Returns the shared tip window, creating it (withdrawn) on first use."""
+        if self._tipwindow is None or not self._tipwindow.winfo_exists():
+            self._tipwindow = tw = tk.Toplevel(self.owner)
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            self._label = tk.Label(tw, justify=tk.LEFT,
+                                   background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                   font=("tahoma", "8", "normal"), wraplength=200)
+            self._label.pack(ipadx=2, ipady=1)
+        return self._tipwindow
 
     def hidetip(self):
-        self.unschedule()
-        tw = self.tipwindow
-        self.tipwindow = None
+        tw = self._tipwindow
         if tw:
             try:
-                tw.destroy()
+                tw.withdraw()
             except tk.TclError:
                 pass
-
-    def force_hide(self, event=None):
-        self.hidetip()
\ No newline at end of file
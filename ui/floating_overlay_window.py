@@ -1,14 +1,31 @@
 # --- START OF FILE ui/floating_overlay_window.py ---
 
+import re
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import font as tkFont
 from tkinter import ttk
 from utils.settings import save_overlay_config_for_roi
 from ui.overlay_tab import SNIP_ROI_NAME # Import SNIP_ROI_NAME
 
+# Tk geometry string "WxH+X+Y" (X/Y may be negative on multi-monitor setups)
+_GEOM_RE = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")
+
+def _parse_geom(geometry):
+    """Returns (w, h, x, y) ints for a "WxH+X+Y" string, or None if it is not one."""
+    m = _GEOM_RE.fullmatch(geometry.strip()) if isinstance(geometry, str) else None
+    if m is None:
+        return None
+    return int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4))
+
 class FloatingOverlayWindow(tk.Toplevel):
     MIN_WIDTH = 50
     MIN_HEIGHT = 30
+    _FONT_CACHE = {} # (family, size) -> tkFont.Font shared across overlays
+    _SCREEN_W = None # Screen size, filled lazily by _screen_size()
+    _SCREEN_H = None
+    # Config keys that feed _update_label_config()
+    _LABEL_KEYS = frozenset({'font_family', 'font_size', 'font_color', 'bg_color', 'wraplength', 'justify'})
 
     def __init__(self, master, roi_name, initial_config, manager_ref):
         super().__init__(master)
@@ -16,6 +33,11 @@ class FloatingOverlayWindow(tk.Toplevel):
         self.config = initial_config.copy() # Use a copy to avoid shared references
         self.master = master
         self.manager = manager_ref # Reference to OverlayManager or None
+        # Resolved once: where geometry saves go (manager method, or direct settings write)
+        self._save_cb = getattr(manager_ref, 'save_specific_overlay_config', None) or save_overlay_config_for_roi
+        # Python-side liveness flag, so hot paths need no Tcl existence check
+        self._alive = True
+        self.bind("<Destroy>", self._on_destroy, add="+")
 
         # Window setup
         self.overrideredirect(True) # No standard window decorations
@@ -32,13 +54,22 @@ class FloatingOverlayWindow(tk.Toplevel):
         self._resize_start_y = 0
         self._resize_start_width = 0
         self._resize_start_height = 0
+        self._save_after_id = None # Pending debounced geometry save
+        self._pending_move = None # Latest drag/resize geometry not yet applied
+        self._motion_after_id = None # Idle callback that applies _pending_move
+        self._vis_after_id = None # Idle callback that applies the visibility state
+        self._batch_depth = 0 # Nesting level of batch_updates()
+        self._batch_dirty = set() # update_config side effects waiting for _flush_dirty()
+        self._pending_geometry = None # Geometry waiting to be written
 
         # Content Frame (allows padding and easier layout)
         self.content_frame = tk.Frame(self, bg=self.config.get('bg_color', '#222222'))
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1) # Small padding for frame
 
         # Main Text Label
+        self._label_state = None # Last (font, fg, bg, wrap, justify) applied to the label
         self.label_var = tk.StringVar()
+        self._last_text = "" # Last text written to label_var
         self.label = tk.Label(
             self.content_frame,
             textvariable=self.label_var,
@@ -52,8 +83,30 @@ class FloatingOverlayWindow(tk.Toplevel):
         self.content_frame.grid_rowconfigure(0, weight=1)
         self.content_frame.grid_columnconfigure(0, weight=1)
 
-        # Resize Grip
+        # Resize Grip: built on first pointer entry, since many overlays are never resized
         self.grip_size = 10
+        self.grip = None
+        self._grip_enter_id = self.bind("<Enter>", self._create_grip, add="+")
+
+        # --- Bind Events ---
+        # Dragging: bound on the Toplevel only. Its tag is in every child's bindtags, so presses
+        # on the label and content frame arrive here once (child bindings would fire twice)
+        self.bind("<ButtonPress-1>", self.on_press)
+        self.bind("<B1-Motion>", self.on_drag)
+        self.bind("<ButtonRelease-1>", self.on_release)
+
+        # Load initial size/position
+        self._load_geometry()
+        # Set initial visibility based on config and manager state
+        # Since manager.capture_active is False initially, this will hide the window
+        # (applied immediately so a new window is never shown for an idle cycle)
+        self._apply_visibility()
+
+    def _create_grip(self, event=None):
+        """Creates the resize grip once, then drops the <Enter> hook that triggered it."""
+        self.unbind("<Enter>", self._grip_enter_id)
+        if self.grip is not None or not self._alive:
+            return
         self.grip = tk.Frame(
             self,
             width=self.grip_size,
@@ -63,30 +116,11 @@ class FloatingOverlayWindow(tk.Toplevel):
         )
         # Place grip at bottom right corner
         self.grip.place(relx=1.0, rely=1.0, anchor='se')
-
-        # --- Bind Events ---
-        # Dragging (bind to window, content frame, and label)
-        self.bind("<ButtonPress-1>", self.on_press)
-        self.bind("<B1-Motion>", self.on_drag)
-        self.bind("<ButtonRelease-1>", self.on_release)
-        self.label.bind("<ButtonPress-1>", self.on_press)
-        self.label.bind("<B1-Motion>", self.on_drag)
-        self.label.bind("<ButtonRelease-1>", self.on_release)
-        self.content_frame.bind("<ButtonPress-1>", self.on_press)
-        self.content_frame.bind("<B1-Motion>", self.on_drag)
-        self.content_frame.bind("<ButtonRelease-1>", self.on_release)
-
         # Resizing (bind only to grip)
         self.grip.bind("<ButtonPress-1>", self.on_resize_press)
         self.grip.bind("<B1-Motion>", self.on_resize_drag)
         self.grip.bind("<ButtonRelease-1>", self.on_resize_release)
 
-        # Load initial size/position
-        self._load_geometry()
-        # Set initial visibility based on config and manager state
-        # Since manager.capture_active is False initially, this will hide the window
-        self._update_visibility()
-
     def _apply_alpha(self):
         """Applies the alpha (transparency) setting from the config."""
         try:
@@ -103,26 +137,26 @@ class FloatingOverlayWindow(tk.Toplevel):
     def _load_geometry(self):
         """Loads window size and position from config, or sets defaults."""
         saved_geometry = self.config.get('geometry')
-        # Check if geometry string looks valid (e.g., "WxH+X+Y")
-        if saved_geometry and isinstance(saved_geometry, str) and 'x' in saved_geometry and '+' in saved_geometry:
-            try:
-                parts = saved_geometry.split('+')
-                size_part, pos_parts = parts[0], parts[1:]
-                if len(pos_parts) == 2 and 'x' in size_part:
-                    w_str, h_str = size_part.split('x')
-                    # Ensure minimum size constraints
-                    w = max(self.MIN_WIDTH, int(w_str))
-                    h = max(self.MIN_HEIGHT, int(h_str))
-                    x, y = int(pos_parts[0]), int(pos_parts[1])
-                    self.geometry(f"{w}x{h}+{x}+{y}")
-                    # print(f"Loaded geometry for {self.roi_name}: {w}x{h}+{x}+{y}") # Debug
-                    return # Success
-            except Exception as e:
-                print(f"Warning: Failed to parse saved geometry '{saved_geometry}' for {self.roi_name}: {e}")
+        if self._apply_geometry(saved_geometry):
+            return # Success
+        if saved_geometry:
+            print(f"Warning: Failed to parse saved geometry '{saved_geometry}' for {self.roi_name}")
         # Fallback if no valid geometry saved
         # print(f"No valid geometry found for {self.roi_name}, centering.") # Debug
         self.center_and_default_size()
 
+    def _apply_geometry(self, geometry):
+        """Applies a "WxH+X+Y" string, enforcing the minimum size. Returns False if it is invalid."""
+        parsed = _parse_geom(geometry)
+        if parsed is None:
+            return False
+        w, h, x, y = parsed
+        try:
+            self.geometry(f"{max(self.MIN_WIDTH, w)}x{max(self.MIN_HEIGHT, h)}+{x}+{y}")
+        except tk.TclError:
+            return False
+        return True
+
     def _save_geometry(self):
         """Saves the current window size and position to the config."""
         # Do not save geometry for the temporary snip window
@@ -130,22 +164,22 @@ class FloatingOverlayWindow(tk.Toplevel):
             return
 
         try:
-            if not self.winfo_exists():
+            if not self._alive:
                 return # Don't save if window is gone
 
             current_geometry = self.geometry()
+            parsed = _parse_geom(current_geometry)
             # Basic check if geometry string looks valid
-            if 'x' in current_geometry and '+' in current_geometry:
-                # Only save if it actually changed
-                if self.config.get('geometry') != current_geometry:
-                    # print(f"Saving geometry for {self.roi_name}: {current_geometry}") # Debug
+            if parsed is not None:
+                # Only save if it actually changed; compare values so textually
+                # different but equivalent strings do not trigger a write
+                if _parse_geom(self.config.get('geometry')) != parsed:
                     self.config['geometry'] = current_geometry
-                    # Use manager's method if available, otherwise direct save
-                    if self.manager and hasattr(self.manager, 'save_specific_overlay_config'):
-                        self.manager.save_specific_overlay_config(self.roi_name, {'geometry': current_geometry})
-                    else:
-                        # Fallback for windows not managed (like snip - though it shouldn't save)
-                        save_overlay_config_for_roi(self.roi_name, {'geometry': current_geometry})
+                    # Debounce the disk write: a burst of drags/resizes only writes the final geometry
+                    self._pending_geometry = current_geometry
+                    if self._save_after_id is not None:
+                        self.after_cancel(self._save_after_id)
+                    self._save_after_id = self.after(300, self._flush_geometry)
             else:
                 # This shouldn't happen if the window exists
                 print(f"Warning: Invalid geometry string generated for {self.roi_name}: {current_geometry}")
@@ -156,17 +190,79 @@ class FloatingOverlayWindow(tk.Toplevel):
         except Exception as e:
             print(f"Error saving geometry for {self.roi_name}: {e}")
 
+    def _cancel_geometry_save(self):
+        """Drops a pending geometry save without writing it."""
+        self._pending_geometry = None
+        if self._save_after_id is not None:
+            try:
+                self.after_cancel(self._save_after_id)
+            except tk.TclError:
+                pass
+            self._save_after_id = None
+
+    def _flush_geometry(self):
+        """Writes the pending geometry to the overlay config, if any."""
+        pending = self._pending_geometry
+        self._cancel_geometry_save()
+        if pending is None:
+            return
+        try:
+            # Manager's method if available, otherwise direct save (resolved in __init__)
+            self._save_cb(self.roi_name, {'geometry': pending})
+        except Exception as e:
+            print(f"Error saving geometry for {self.roi_name}: {e}")
+
+    def _on_destroy(self, event):
+        # The Toplevel's tag is in its children's bindtags; only our own <Destroy> counts
+        if event.widget is self:
+            self._alive = False
+
+    def destroy(self):
+        self._alive = False
+        for after_id in (self._motion_after_id, self._vis_after_id):
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+        self._motion_after_id = self._vis_after_id = None
+        self._flush_geometry() # Persist a geometry still waiting on the debounce
+        super().destroy()
+
+    def _schedule_geometry(self, geometry):
+        """Records a drag/resize target; motion events queued together apply only the last one."""
+        self._pending_move = geometry
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after_idle(self._apply_pending_geometry)
+
+    def _apply_pending_geometry(self):
+        self._motion_after_id = None
+        geometry = self._pending_move
+        self._pending_move = None
+        if geometry is None:
+            return
+        try:
+            self.geometry(geometry)
+        except tk.TclError: pass # Ignore if window destroyed
+
+    def _screen_size(self):
+        """Returns (width, height) of the screen, queried once per process."""
+        cls = FloatingOverlayWindow
+        if cls._SCREEN_W is None:
+            cls._SCREEN_W = self.winfo_screenwidth()
+            cls._SCREEN_H = self.winfo_screenheight()
+        return cls._SCREEN_W, cls._SCREEN_H
+
     def center_and_default_size(self):
         """Sets a default size and centers the window roughly."""
         try:
-            self.update_idletasks() # Ensure dimensions are calculated if possible
-
+            # No layout flush needed: the default size comes from config and screen size only,
+            # never from measured child sizes
             # Estimate default width based on wraplength + padding
             default_width = max(self.MIN_WIDTH, self.config.get('wraplength', 450) + 20)
             default_height = max(self.MIN_HEIGHT, 50) # Default height
 
-            screen_width = self.winfo_screenwidth()
-            screen_height = self.winfo_screenheight()
+            screen_width, screen_height = self._screen_size()
 
             # Center horizontally, place in upper third vertically
             x = max(0, (screen_width // 2) - (default_width // 2))
@@ -191,13 +287,25 @@ class FloatingOverlayWindow(tk.Toplevel):
         justify_map = {'left': tk.LEFT, 'center': tk.CENTER, 'right': tk.RIGHT}
         justify_align = justify_map.get(self.config.get('justify', 'left'), tk.LEFT)
 
-        try:
-            # Create font object
-            label_font = tkFont.Font(family=font_family, size=font_size)
-        except tk.TclError:
-            # Fallback if font family is invalid
-            print(f"Warning: Font family '{font_family}' not found for {self.roi_name}. Using default.")
-            label_font = tkFont.Font(size=font_size)
+        # Font objects are shared by all overlays; each new one is a named Tcl font
+        font_key = (font_family, font_size)
+        label_font = self._FONT_CACHE.get(font_key)
+        if label_font is None:
+            try:
+                # Create font object
+                label_font = tkFont.Font(root=self._root(), family=font_family, size=font_size)
+            except tk.TclError:
+                # Fallback if font family is invalid
+                print(f"Warning: Font family '{font_family}' not found for {self.roi_name}. Using default.")
+                label_font = tkFont.Font(root=self._root(), size=font_size)
+            self._FONT_CACHE[font_key] = label_font
+
+        # Skip the Tk calls entirely when nothing visual changed
+        label_state = (label_font, font_color, bg_color, wraplength, justify_align)
+        if label_state == self._label_state:
+            return
+        bg_changed = self._label_state is None or self._label_state[2] != bg_color
+        self._label_state = label_state
 
         # Configure the label
         self.label.config(
@@ -207,9 +315,10 @@ class FloatingOverlayWindow(tk.Toplevel):
             wraplength=wraplength,
             justify=justify_align
         )
-        # Update background colors of containers
-        self.content_frame.config(bg=bg_color)
-        self.configure(background=bg_color) # Window background
+        if bg_changed:
+            # Update background colors of containers
+            self.content_frame.config(bg=bg_color)
+            self.configure(background=bg_color) # Window background
 
     def update_text(self, text):
         """Updates the label text variable. Does NOT control visibility."""
@@ -217,31 +326,32 @@ class FloatingOverlayWindow(tk.Toplevel):
         if not isinstance(text, str):
             text = str(text)
 
-        # Update text variable only if changed
-        if text != self.label_var.get():
+        # Update text variable only if changed (compared against the Python-side copy,
+        # so unchanged text costs no Tcl variable read)
+        if text != self._last_text and self._alive:
             try:
-                # Check if window still exists before setting var
-                if self.winfo_exists():
-                    self.label_var.set(text)
+                self.label_var.set(text)
+                self._last_text = text
             except tk.TclError:
                 return # Window is gone
 
     def _update_visibility(self):
+        """Schedules a visibility sync; repeated requests within one idle cycle apply once."""
+        if self._alive and self._vis_after_id is None:
+            self._vis_after_id = self.after_idle(self._apply_visibility)
+
+    def _apply_visibility(self):
         """Shows or hides the window based on capture state, global and individual enabled states."""
-        try:
-            if not self.winfo_exists():
-                return
-        except tk.TclError:
+        self._vis_after_id = None
+        if not self._alive:
             return # Window is gone
 
         # Determine if the window *should* be visible
-        manager_exists = self.manager is not None
-        is_capture_active = manager_exists and getattr(self.manager, 'capture_active', False)
-        is_globally_enabled = manager_exists and getattr(self.manager, 'global_overlays_enabled', True)
-        is_individually_enabled = self.config.get('enabled', True)
-
         # Normal ROI: visible only if capture active AND globally enabled AND individually enabled
-        should_be_visible = is_capture_active and is_globally_enabled and is_individually_enabled
+        # (both flags are plain OverlayManager attributes, so no getattr probing is needed)
+        manager = self.manager
+        should_be_visible = (manager is not None and manager.capture_active
+                             and manager.global_overlays_enabled and self.config.get('enabled', True))
 
         # Get current visibility state
         try:
@@ -263,17 +373,19 @@ class FloatingOverlayWindow(tk.Toplevel):
     def update_config(self, new_config):
         """Applies a new configuration dictionary to the window."""
         needs_geom_reload = False
-        enabled_state_changed = False
-
-        # Check if 'enabled' state is changing
-        if 'enabled' in new_config and new_config['enabled'] != self.config.get('enabled'):
-            enabled_state_changed = True
+        if self._pending_geometry is not None and new_config.get('geometry') is not None:
+            # A drag/resize save is still debounced, so a config reloaded from disk carries
+            # the old geometry; the window's own (newer) geometry wins until the flush
+            new_config = {k: v for k, v in new_config.items() if k != 'geometry'}
+        # Only keys whose value actually moves drive the sub-updates below
+        changed = {k for k, v in new_config.items() if self.config.get(k) != v}
 
         # Check if geometry needs reloading (e.g., reset button)
-        if 'geometry' in new_config and new_config['geometry'] != self.config.get('geometry'):
+        if 'geometry' in changed:
             # If new geometry is explicitly None, trigger reload/reset
             if new_config['geometry'] is None:
                 needs_geom_reload = True
+                self._cancel_geometry_save() # A pending save must not undo the reset
                 # Keep existing geometry in self.config until reload happens
                 # but remove it from new_config so it doesn't overwrite immediately
                 del new_config['geometry']
@@ -281,55 +393,70 @@ class FloatingOverlayWindow(tk.Toplevel):
         # Update the internal config dictionary
         self.config.update(new_config) # Use update to merge changes
 
+        # Record which side effects are needed; inside batch_updates() they run once at the end
+        dirty = self._batch_dirty
         # Apply visual changes
-        self._update_label_config()
-        self._apply_alpha()
-
+        if changed & self._LABEL_KEYS:
+            dirty.add('label')
+        if 'alpha' in changed:
+            dirty.add('alpha')
         # Reload geometry if requested (e.g., reset)
         if needs_geom_reload:
-            self._load_geometry()
+            dirty.discard('geom')
+            dirty.add('geom_reload')
         # If geometry was provided directly in new_config (and not None), apply it
-        elif 'geometry' in new_config and new_config['geometry'] is not None:
+        elif 'geometry' in changed and new_config.get('geometry') is not None:
+            dirty.discard('geom_reload')
+            dirty.add('geom')
+        # Update visibility if the 'enabled' state changed or geometry was reset
+        # (capture/global state changes reach the window through the manager instead)
+        if 'enabled' in changed or needs_geom_reload:
+            dirty.add('vis')
+
+        if self._batch_depth == 0:
+            self._flush_dirty()
+
+    @contextmanager
+    def batch_updates(self):
+        """Defers update_config side effects until the outermost batch exits (reentrant)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_dirty()
+
+    def _flush_dirty(self):
+        """Runs each pending update_config side effect once."""
+        dirty = self._batch_dirty
+        if not dirty:
+            return
+        self._batch_dirty = set()
+        if 'label' in dirty:
+            self._update_label_config()
+        if 'alpha' in dirty:
+            self._apply_alpha()
+        if 'geom_reload' in dirty:
+            self._load_geometry()
+        elif 'geom' in dirty:
             # Ensure minimum size constraints are met when applying directly
-            try:
-                parts = new_config['geometry'].split('+')
-                size_part, pos_parts = parts[0], parts[1:]
-                if len(pos_parts) == 2 and 'x' in size_part:
-                    w_str, h_str = size_part.split('x')
-                    w = max(self.MIN_WIDTH, int(w_str))
-                    h = max(self.MIN_HEIGHT, int(h_str))
-                    x, y = int(pos_parts[0]), int(pos_parts[1])
-                    self.geometry(f"{w}x{h}+{x}+{y}")
-            except Exception:
-                print(f"Warning: Failed to apply specific geometry '{new_config['geometry']}' for {self.roi_name}")
+            geometry = self.config.get('geometry')
+            if not self._apply_geometry(geometry):
+                print(f"Warning: Failed to apply specific geometry '{geometry}' for {self.roi_name}")
                 self._load_geometry() # Fallback to load/default
-
-        # Update visibility if the 'enabled' state changed or geometry was reset
-        # Let _update_visibility handle the logic based on capture state etc.
-        self._update_visibility()
+        if 'vis' in dirty:
+            # Let _update_visibility handle the logic based on capture state etc.
+            self._update_visibility()
 
     # --- Dragging Methods ---
     def on_press(self, event):
         """Records click offset for dragging, ignores clicks on grip/close button."""
-        # Check if the click originated from the grip or a close button
+        # Check if the click originated from the grip or a close button. Neither has child
+        # widgets, so the event widget itself is enough (no parent walk needed)
         widget = event.widget
-        while widget is not None:
-            if widget == self.grip or getattr(widget, '_is_close_button', False):
-                return # Do not start drag if click is on grip or close button
-            # Check if the widget is the label itself, allow drag
-            if widget == self.label:
-                break
-            # Check if the widget is the content frame, allow drag
-            if widget == self.content_frame:
-                break
-            # Check if the widget is the main Toplevel window, allow drag
-            if widget == self:
-                break
-            widget = widget.master # Check parent widget
-
-        # If the loop finished without breaking (i.e., widget is None or not allowed), return
-        if widget is None:
-            return
+        if widget is self.grip or isinstance(widget, _CloseButton):
+            return # Do not start drag if click is on grip or close button
 
         # Start dragging state
         self._offset_x = event.x
@@ -343,17 +470,15 @@ class FloatingOverlayWindow(tk.Toplevel):
         # Calculate new window position
         new_x = self.winfo_x() + event.x - self._offset_x
         new_y = self.winfo_y() + event.y - self._offset_y
-        # Apply new position
-        if self.winfo_exists():
-            try:
-                self.geometry(f"+{new_x}+{new_y}")
-            except tk.TclError: pass # Ignore if window destroyed
+        # Apply new position once the pending motion events are processed
+        self._schedule_geometry(f"+{new_x}+{new_y}")
 
     def on_release(self, event):
         """Ends dragging state and saves the new position."""
         if not self._dragging:
             return
         self._dragging = False
+        self._apply_pending_geometry() # Apply the final position before reading it back
         self._save_geometry() # Save position after dragging stops
 
     # --- Resizing Methods ---
@@ -363,7 +488,7 @@ class FloatingOverlayWindow(tk.Toplevel):
         self._resize_start_x = event.x_root # Use screen coordinates for resize start
         self._resize_start_y = event.y_root
         # Get current size safely
-        if not self.winfo_exists():
+        if not self._alive:
             self._resizing = False
             return
         try:
@@ -384,25 +509,26 @@ class FloatingOverlayWindow(tk.Toplevel):
         new_width = max(self.MIN_WIDTH, self._resize_start_width + delta_x)
         new_height = max(self.MIN_HEIGHT, self._resize_start_height + delta_y)
         # Apply new size (position remains the same during resize)
-        if self.winfo_exists():
-            try:
-                current_x = self.winfo_x()
-                current_y = self.winfo_y()
-                self.geometry(f"{new_width}x{new_height}+{current_x}+{current_y}")
-            except tk.TclError: pass # Ignore if window destroyed
+        try:
+            current_x = self.winfo_x()
+            current_y = self.winfo_y()
+        except tk.TclError:
+            return # Ignore if window destroyed
+        self._schedule_geometry(f"{new_width}x{new_height}+{current_x}+{current_y}")
 
     def on_resize_release(self, event):
         """Ends resizing state and saves the new size/position."""
         if not self._resizing:
             return
         self._resizing = False
+        self._apply_pending_geometry() # Apply the final size before reading it back
         self._save_geometry() # Save size/position after resizing stops
 
     def destroy_window(self):
         """Safely destroys the window."""
         # print(f"Destroying window for {self.roi_name}") # Debug
         try:
-            if self.winfo_exists():
+            if self._alive:
                 self.destroy()
         except tk.TclError:
             # print(f"Debug: TclError destroying window {self.roi_name} (already gone?)")
@@ -411,6 +537,21 @@ class FloatingOverlayWindow(tk.Toplevel):
             print(f"Error destroying window {self.roi_name}: {e}")
 
 
+class _CloseButton(ttk.Button):
+    """Overlay close button; its type lets on_press skip starting a drag."""
+
+_close_style_configured = False
+
+def _configure_close_style(root):
+    """Registers the small close button's ttk style once; ttk styles are interpreter-global."""
+    global _close_style_configured
+    if _close_style_configured:
+        return
+    style = ttk.Style(root)
+    # Configure padding and font size for the button style
+    style.configure("Close.TButton", padding=0, font=('Segoe UI', 7))
+    _close_style_configured = True
+
 class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
     """A floating overlay window with a small close button and auto-resizing."""
     # Define reasonable max width relative to screen, can be adjusted
@@ -422,22 +563,17 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
     def __init__(self, master, roi_name, initial_config, manager_ref):
         super().__init__(master, roi_name, initial_config, manager_ref)
 
-        # Style for the small close button
-        style = ttk.Style(self)
-        # Configure padding and font size for the button style
-        style.configure("Close.TButton", padding=0, font=('Segoe UI', 7))
+        # Style for the small close button (registered once per process)
+        _configure_close_style(self)
 
         # Create the close button
-        self.close_button = ttk.Button(
+        self.close_button = _CloseButton(
             self.content_frame, # Place button inside the content frame
             text="✕", # Close symbol (Unicode multiplication sign)
             command=self.destroy_window, # Command to close the window
             width=2, # Make button small
             style="Close.TButton" # Apply the custom style
         )
-        # Add a flag to identify this button during drag checks
-        self.close_button._is_close_button = True
-
         # Place the button in the top-right corner of the content frame grid
         self.close_button.grid(row=0, column=1, sticky="ne", padx=(0, 1), pady=(1, 0))
 
@@ -449,11 +585,11 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
         # print(f"Skipping geometry save for closable window: {self.roi_name}") # Debug
         pass # Do not save geometry for temporary/closable windows
 
-    def _update_visibility(self):
+    def _apply_visibility(self):
         """Override visibility for closable windows - they are always visible when they exist."""
         # This override ensures the snip window ignores manager/capture state
         try:
-            if not self.winfo_exists():
+            if not self._alive:
                 return
             # Ensure it's shown if it exists and not already visible
             if self.state() != 'normal':
@@ -469,7 +605,7 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
 
         # 2. Trigger UI updates to calculate required sizes
         try:
-            if not self.winfo_exists(): return
+            if not self._alive: return
             self.update_idletasks()
         except tk.TclError:
             return # Window gone
@@ -479,7 +615,7 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
             req_h = self.label.winfo_reqheight()
             req_w = self.label.winfo_reqwidth()
             # Add padding and button width if it exists
-            close_btn_w = self.close_button.winfo_reqwidth() if hasattr(self, 'close_button') and self.close_button.winfo_exists() else 0
+            close_btn_w = self.close_button.winfo_reqwidth() if hasattr(self, 'close_button') else 0
 
             new_w = req_w + close_btn_w + self.HORIZONTAL_PADDING
             new_h = req_h + self.VERTICAL_PADDING
@@ -489,7 +625,7 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
             final_h = max(self.MIN_HEIGHT, new_h)
 
             # Enforce maximum width
-            max_w = int(self.winfo_screenwidth() * self.MAX_WIDTH_FACTOR)
+            max_w = int(self._screen_size()[0] * self.MAX_WIDTH_FACTOR)
             final_w = min(final_w, max_w)
 
             # 4. Get current position
@@ -506,4 +642,4 @@ class ClosableFloatingOverlayWindow(FloatingOverlayWindow):
             print(f"Error auto-resizing snip window: {e}")
 
         # 6. Ensure visibility (redundant due to override, but safe)
-        self._update_visibility()
\ No newline at end of file
+        self._apply_visibility()
\ No newline at end of file
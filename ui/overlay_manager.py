@@ -21,7 +21,8 @@ class OverlayManager:
         if roi_name in self.overlays:
             config = self._get_roi_config(roi_name)
             self.overlays[roi_name].update_config(config)
-            # Visibility is handled by _update_visibility called within update_config
+            # update_config only re-syncs visibility when 'enabled' changes; re-sync explicitly
+            self.overlays[roi_name]._update_visibility()
             # print(f"Overlay for {roi_name} already exists, updated config.")
             return
 
@@ -84,7 +85,7 @@ class OverlayManager:
         # Destroy overlays for ROIs that no longer exist in the app's list
         names_to_remove = set(self.overlays.keys()) - processed_roi_names
         for roi_name in names_to_remove:
-            self.destroy_overlay(roi_name)
+            self.destroy_overlay(roi_name, discard_geometry=True)
 
     def clear_all_overlays(self):
         """Clears the text content of all managed overlay windows."""
@@ -107,10 +108,16 @@ class OverlayManager:
         for overlay in self.overlays.values():
             overlay._update_visibility() # Let the window decide based on all states
 
-    def destroy_overlay(self, roi_name):
-        """Safely destroys a specific overlay window and removes it from management."""
+    def destroy_overlay(self, roi_name, discard_geometry=False):
+        """Safely destroys a specific overlay window and removes it from management.
+
+        discard_geometry drops a not-yet-written geometry save; use it when the ROI itself
+        was removed, so destroying the window does not write its settings entry back.
+        """
         if roi_name in self.overlays:
             overlay = self.overlays[roi_name]
+            if discard_geometry:
+                overlay._cancel_geometry_save()
             # print(f"OverlayManager: Destroying overlay for {roi_name}")
             if overlay.winfo_exists():
                 overlay.destroy_window()
@@ -145,7 +152,8 @@ class OverlayManager:
             if roi_name in self.overlays:
                 # print(f"OverlayManager: Applying live config update to {roi_name}")
                 self.overlays[roi_name].update_config(live_config)
-                # update_config calls _update_visibility internally if needed
+                # update_config re-syncs visibility itself when 'enabled' changes or geometry is reset;
+                # capture/global state changes go through show_all_overlays/hide_all_overlays
             else:
                 # If overlay doesn't exist, check if it *should* exist now
                 is_enabled_now = live_config.get('enabled', True)
@@ -178,8 +186,10 @@ class OverlayManager:
             # Update UI elements in other tabs (thread-safe checks)
             try:
                 if self.app.floating_controls and self.app.floating_controls.winfo_exists():
-                    if hasattr(self.app.floating_controls, 'overlay_var'):
-                        self.app.floating_controls.overlay_var.set(enabled)
+                    overlay_var = getattr(self.app.floating_controls, 'overlay_var', None)
+                    # Skip the write when the floating toggle already shows this value
+                    if overlay_var is not None and overlay_var.get() != enabled:
+                        overlay_var.set(enabled)
             except Exception as e:
                 print(f"Error updating floating controls overlay state: {e}")
 
@@ -846,7 +846,7 @@ class ROITab(BaseTab):
             update_settings({"overlay_settings": all_overlay_settings})
 
         if hasattr(self.app, 'overlay_manager'):
-            self.app.overlay_manager.destroy_overlay(roi.name)
+            self.app.overlay_manager.destroy_overlay(roi.name, discard_geometry=True)
 
         if roi.name in self.app.text_history: del self.app.text_history[roi.name]
         if roi.name in self.app.stable_texts: del self.app.stable_texts[roi.name]
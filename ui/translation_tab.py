@@ -350,15 +350,19 @@ class TranslationTab(BaseTab):
         if event and event.keysym == 'Return':
             return "break"
 
-    def toggle_auto_translate(self):
-        """Save the auto-translate setting."""
+    def toggle_auto_translate(self, enabled=None):
+        """Save the auto-translate setting. Callers other than the checkbox pass the new value."""
+        if enabled is not None and enabled != self.auto_translate_var.get():
+            self.auto_translate_var.set(enabled)
         self.auto_translate_enabled = self.auto_translate_var.get()
         if set_setting("auto_translate", self.auto_translate_enabled):
             status_msg = f"Auto-translate {'enabled' if self.auto_translate_enabled else 'disabled'}."
             print(status_msg)
             self.app.update_status(status_msg)
+            # Mirror into the floating controls only if they don't already show this value
             if self.app.floating_controls and self.app.floating_controls.winfo_exists():
-                self.app.floating_controls.auto_var.set(self.auto_translate_enabled)
+                if self.app.floating_controls.auto_var.get() != self.auto_translate_enabled:
+                    self.app.floating_controls.auto_var.set(self.auto_translate_enabled)
         else: messagebox.showerror("Error", "Failed to save auto-translate setting.")
 
     def is_auto_translate_enabled(self):
@@ -4,6 +4,7 @@ import win32con
 import mss
 import numpy as np
 import cv2
+import ctypes
 from ctypes import windll, byref, wintypes
 import time
 import win32process
@@ -12,23 +13,37 @@ import os
 
 LOG_CAPTURE_DETAILS = False
 
-def enum_window_callback(hwnd, windows):
-    try:
-        if not win32gui.IsWindowVisible(hwnd):
-            return True
-        if not win32gui.GetWindowText(hwnd):
-            return True
-        if win32gui.IsIconic(hwnd):
-            return True
-        windows.append(hwnd)
-    except Exception:
-        pass
-    return True
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_TITLE_BUF_LEN = 512
+_EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+# Explicit prototypes: HWND stays pointer-sized and return values are not guessed as c_int
+_user32.EnumWindows.argtypes = (_EnumWindowsProc, wintypes.LPARAM)
+_user32.EnumWindows.restype = wintypes.BOOL
+_user32.IsWindowVisible.argtypes = (wintypes.HWND,)
+_user32.IsWindowVisible.restype = wintypes.BOOL
+_user32.IsIconic.argtypes = (wintypes.HWND,)
+_user32.IsIconic.restype = wintypes.BOOL
+_user32.GetWindowTextLengthW.argtypes = (wintypes.HWND,)
+_user32.GetWindowTextLengthW.restype = ctypes.c_int
+_user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+_user32.GetWindowTextW.restype = ctypes.c_int
 
-def get_windows():
+def get_windows_with_titles():
     windows = []
+    # One buffer per enumeration, reused for every window (safe to call from worker threads)
+    title_buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
+    def callback(hwnd, _):
+        try:
+            if (_user32.IsWindowVisible(hwnd) and not _user32.IsIconic(hwnd)
+                    and _user32.GetWindowTextLengthW(hwnd)):
+                _user32.GetWindowTextW(hwnd, title_buf, _TITLE_BUF_LEN)
+                if title_buf.value:
+                    windows.append((hwnd, title_buf.value))
+        except Exception:
+            pass
+        return True
     try:
-        win32gui.EnumWindows(enum_window_callback, windows)
+        _user32.EnumWindows(_EnumWindowsProc(callback), 0)
     except Exception as e:
         print(f"Error during EnumWindows: {e}")
     return windows